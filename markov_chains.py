@@ -4,17 +4,85 @@ Rock, Paper, Scissors Game with Markov Chains
 This module contains the implementation of a Rock, Paper, Scissors game
 using tkinter GUI and Markov chains for AI decision-making.
 """
+from __future__ import annotations
+
 import tkinter as tk
+from bisect import bisect
+from functools import partial
+from random import random as _rand
 from tkinter import ttk, messagebox
-import dataclasses
-from typing import Callable
-import numpy as np
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback decorator running the kernels as plain Python when numba is absent."""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorate(func: Callable) -> Callable:
+            return func
+        return decorate
+
+STATES_IDX = {"Rock": 0, "Paper": 1, "Scissors": 2}
+# For each observed state c: the index to boost, the two indices to shrink.
+_LEARN_TRIPLES = tuple(((c + 1) % 3, (c + 2) % 3, c) for c in range(3))
+_RESULTS = ("You lost!", "It's a tie!", "You won!")
+_FONT = ("Arial", 16)
+
+
+@njit(cache=True)
+def sample_index(cum_row: np.ndarray, uniform: float) -> int:
+    """
+    Draw a state index from a cumulative probability row.
+
+    Args:
+        cum_row (np.ndarray): Cumulative probabilities of one transition row.
+        uniform (float): A uniform random number in [0, 1).
+
+    Returns:
+        int: The index of the sampled state.
+    """
+    for index in range(3):
+        if uniform < cum_row[index]:
+            return index
+    return 2
+
+
+@njit(cache=True)
+def learn_inplace(matrix: np.ndarray, cum: np.ndarray, previous_index: int,
+                  current_index: int, deltas: np.ndarray) -> None:
+    """
+    Apply one learning step to the transition matrix and its cumulative cache.
+
+    Args:
+        matrix (np.ndarray): The 3x3 transition matrix, updated in place.
+        cum (np.ndarray): Cumulative copy of the matrix, updated in place.
+        previous_index (int): Index representing the previous state.
+        current_index (int): Index representing the current state.
+        deltas (np.ndarray): Per-state adjustment vectors.
+    """
+    new_row = matrix[previous_index] + deltas[current_index]
+    if (new_row >= 0).all() and (new_row <= 1).all():
+        matrix[previous_index] = new_row
+        total = 0.0
+        for index in range(3):
+            total += matrix[previous_index][index]
+            cum[previous_index][index] = total
 
 
 def check_result(player_selection: str, ai_selection: str) -> int:
     """
     Determine the result of a round of Rock-Paper-Scissors game.
 
+    Each state beats the one directly before it in the Rock -> Paper -> Scissors
+    cycle, so the index difference modulo 3 decides the round without building
+    a lookup table per call.
+
     Args:
         player_selection (str): The player's selection ("Rock", "Paper", or "Scissors").
         ai_selection (str): The AI's selection ("Rock", "Paper", or "Scissors").
@@ -22,18 +90,8 @@ def check_result(player_selection: str, ai_selection: str) -> int:
     Returns:
         int: Result of the round; 1 if the player wins, -1 if the AI wins, 0 if it's a tie.
     """
-    possible_results = {
-        ("Rock", "Scissors"): 1,
-        ("Paper", "Rock"): 1,
-        ("Scissors", "Paper"): 1,
-        ("Rock", "Paper"): -1,
-        ("Paper", "Scissors"): -1,
-        ("Scissors", "Rock"): -1,
-    }
-    if (player_selection, ai_selection) in possible_results:
-        result = possible_results[(player_selection, ai_selection)]
-        return result
-    return 0
+    difference = (STATES_IDX[player_selection] - STATES_IDX[ai_selection]) % 3
+    return (0, 1, -1)[difference]
 
 
 def get_index(selection: str) -> int:
@@ -44,20 +102,11 @@ def get_index(selection: str) -> int:
         selection (str): The selection ("Rock", "Paper", or "Scissors").
 
     Returns:
-        int: The index of the selection in the states array.
+        int: The index of the selection in the states array, or -1 if unknown.
     """
-    match selection:
-        case "Rock":
-            return 0
-        case "Paper":
-            return 1
-        case "Scissors":
-            return 2
-        case _:
-            return -1
-
-
-@dataclasses.dataclass
+    return STATES_IDX.get(selection, -1)
+
+
 class ButtonManager:
     """
     Manage the creation and functionality of buttons in the GUI.
@@ -88,14 +137,12 @@ class ButtonManager:
             ttk.Button: The created button.
         """
         button = ttk.Button(self.button_frame, text=player_selection,
-                            command=lambda: self.play_game_func(player_selection),
+                            command=partial(self.play_game_func, player_selection),
                             width=10, padding=5)
         button.pack(side="left", padx=5, pady=5)
-        button.configure(style="TButton")
         return button
 
 
-@dataclasses.dataclass
 class TopLabelManager:
     """
     Manage the top labels in the GUI.
@@ -116,11 +163,10 @@ class TopLabelManager:
         self.player_score_label = player_score_label
         self.player_score_label.grid(row=0, column=1)
 
-        self.label = tk.Label(root, text="Select your move:", font=("Arial", 16))
+        self.label = tk.Label(root, text="Select your move:", font=_FONT)
         self.label.pack()
 
 
-@dataclasses.dataclass
 class BottomLabelManager:
     """
     Manage the bottom labels in the GUI.
@@ -130,14 +176,13 @@ class BottomLabelManager:
         round_result_label (tk.Label): Label displaying the result of the round.
     """
     def __init__(self, root: tk.Tk) -> None:
-        self.ai_selection_label = tk.Label(root)
+        self.ai_selection_label = tk.Label(root, font=_FONT)
         self.ai_selection_label.pack()
 
         self.round_result_label = tk.Label(root, font=("Arial", 30))
         self.round_result_label.pack()
 
 
-@dataclasses.dataclass
 class WindowStyleManager:
     """
     Manage the style and appearance of the GUI window.
@@ -152,7 +197,7 @@ class WindowStyleManager:
         self.window_width = window_width
         self.window_height = window_height
         self.style = ttk.Style(root)
-        self.style.configure("TButton", font=("Arial", 16))
+        self.style.configure("TButton", font=_FONT)
         self.center_window(root)
 
     def center_window(self, root: tk.Tk) -> None:
@@ -171,7 +216,6 @@ class WindowStyleManager:
         root.geometry(f"{self.window_width}x{self.window_height}+{x_axis}+{y_axis}")
 
 
-@dataclasses.dataclass
 class GUIManager:
     """
     Manage the overall GUI components.
@@ -196,53 +240,123 @@ class GUIManager:
         self.bottom_label_manager = BottomLabelManager(self.root)
 
 
-@dataclasses.dataclass
 class PointsManager:
     """
     Manage points scored in the game.
 
     Attributes:
-        all_ai_points (np.ndarray): Array storing points scored by AI.
-        all_player_points (np.ndarray): Array storing points scored by the player.
+        player_score (int): Running total of points scored by the player.
+        ai_score (int): Running total of points scored by the AI.
+        wins (int): Number of rounds won by the player.
+        losses (int): Number of rounds lost by the player.
     """
-    def __init__(self, all_ai_points: np.ndarray, all_player_points: np.ndarray) -> None:
-        self.all_ai_points = all_ai_points
-        self.all_player_points = all_player_points
+    __slots__ = ("player_score", "ai_score", "wins", "losses")
+
+    def __init__(self) -> None:
+        self.player_score = 0
+        self.ai_score = 0
+        self.wins = 0
+        self.losses = 0
 
 
-@dataclasses.dataclass
 class TransitionManager:
     """
     Manage transitions between game states.
 
+    The live game keeps the 3x3 matrix as a flat row-major list of nine
+    floats; at this size plain list indexing beats ndarray scalar access,
+    so the click path never enters NumPy.
+
     Attributes:
-        transition_matrix (np.ndarray): Matrix representing transition probabilities.
+        transition_matrix (list[float]): Flat row-major matrix of transition probabilities.
         transition_adjustment (float): Adjustment factor for transition probabilities.
     """
+    __slots__ = ("transition_matrix", "transition_adjustment", "_cum")
+
     def __init__(self) -> None:
-        self.transition_matrix = np.array([[1 / 3, 1 / 3, 1 / 3],
-                                           [1 / 3, 1 / 3, 1 / 3],
-                                           [1 / 3, 1 / 3, 1 / 3]])
+        self.transition_matrix = [1 / 3] * 9
         self.transition_adjustment = 0.05
+        self._cum = [1 / 3, 2 / 3, 1.0] * 3
 
     def learn(self, previous_index: int, current_index: int) -> None:
         """
         Update transition probabilities based on the previous and current indices.
 
+        The update is applied only when it keeps every probability in [0, 1].
+
         Args:
             previous_index (int): Index representing the previous state.
             current_index (int): Index representing the current state.
         """
-        i, j, k = ((current_index + 1) % 3, (current_index + 2) % 3, current_index)
-        if (self.transition_matrix[previous_index][k] - self.transition_adjustment / 2 >= 0 and
-                self.transition_matrix[previous_index][j] - self.transition_adjustment / 2 >= 0 and
-                self.transition_matrix[previous_index][i] + self.transition_adjustment <= 1):
-            self.transition_matrix[previous_index][k] -= self.transition_adjustment / 2
-            self.transition_matrix[previous_index][j] -= self.transition_adjustment / 2
-            self.transition_matrix[previous_index][i] += self.transition_adjustment
+        adjustment = self.transition_adjustment
+        half = adjustment / 2
+        i, j, k = _LEARN_TRIPLES[current_index]
+        base = previous_index * 3
+        matrix = self.transition_matrix
+        if (matrix[base + k] - half >= 0 and
+                matrix[base + j] - half >= 0 and
+                matrix[base + i] + adjustment <= 1):
+            matrix[base + k] -= half
+            matrix[base + j] -= half
+            matrix[base + i] += adjustment
+            cum = self._cum
+            cum[base] = matrix[base]
+            cum[base + 1] = cum[base] + matrix[base + 1]
+            cum[base + 2] = cum[base + 1] + matrix[base + 2]
+
+    def sample(self, previous_index: int, uniform: float) -> int:
+        """
+        Draw the next state index from the cumulative transition row.
+
+        Args:
+            previous_index (int): Index representing the previous state.
+            uniform (float): A uniform random number in [0, 1).
+
+        Returns:
+            int: The index of the sampled state.
+        """
+        # Search only the first two boundaries: float drift can leave the
+        # row's cumulative top just below 1.0, so index 2 is the fallback.
+        base = previous_index * 3
+        return bisect(self._cum, uniform, base, base + 2) - base
+
+    @staticmethod
+    def simulate_batch(player_indices: np.ndarray, transition_adjustment: float = 0.05,
+                       seed: int | None = None) -> np.ndarray:
+        """
+        Simulate a batch of rounds against a fixed sequence of player moves.
+
+        Runs the same sample/learn loop as the live game without any GUI work,
+        drawing all uniform numbers up front, which makes it suitable for
+        tuning transition_adjustment by Monte Carlo self-play.
+
+        Args:
+            player_indices (np.ndarray): State indices of the player's moves, in order.
+            transition_adjustment (float): Adjustment factor for transition probabilities.
+            seed (int | None): Optional seed for reproducible draws.
+
+        Returns:
+            np.ndarray: Results per round; 1 if the player won, -1 if the AI won, 0 for ties.
+        """
+        import numpy as np
+
+        matrix = np.full((3, 3), 1 / 3)
+        cum = np.cumsum(matrix, axis=1)
+        deltas = np.full((3, 3), -transition_adjustment / 2)
+        for current_index in range(3):
+            deltas[current_index][(current_index + 1) % 3] = transition_adjustment
+        uniforms = np.random.default_rng(seed).random(len(player_indices))
+        results = np.zeros(len(player_indices), dtype=int)
+        previous_index = 0
+        for num_round, current_index in enumerate(player_indices):
+            ai_index = sample_index(cum[previous_index], uniforms[num_round])
+            results[num_round] = (0, 1, -1)[(current_index - ai_index) % 3]
+            if num_round > 0:
+                learn_inplace(matrix, cum, previous_index, current_index, deltas)
+            previous_index = current_index
+        return results
 
 
-@dataclasses.dataclass
 class GameManager:
     """
    Manage the game state.
@@ -251,6 +365,8 @@ class GameManager:
        num_of_games (int): Number of games played.
        num_round (int): Current round number.
    """
+    __slots__ = ("num_of_games", "num_round")
+
     def __init__(self, number_of_games: int) -> None:
         self.num_of_games = number_of_games
         self.num_round = 0
@@ -261,35 +377,36 @@ class RockPaperScissorsGame:
     Main class to control the Rock, Paper, Scissors game.
 
     Attributes:
-        states (np.ndarray): Array representing game states ("Rock", "Paper", "Scissors").
+        states (tuple): Tuple of the game states ("Rock", "Paper", "Scissors").
         transition_manager (TransitionManager): Manager for state transitions.
         game_manager (GameManager): Manager for the game state.
         points_manager (PointsManager): Manager for points scored.
         previous_user_selection (str): Previous user selection.
         gui_manager (GUIManager): Manager for GUI components.
     """
+    __slots__ = ("states", "transition_manager", "game_manager", "points_manager",
+                 "previous_user_selection", "_last_round_str", "_last_ai_str",
+                 "_last_player_str", "top_label_manager", "gui_manager")
+
     def __init__(self, number_of_games: int = 30) -> None:
-        self.states = np.array(["Rock", "Paper", "Scissors"])
+        self.states = ("Rock", "Paper", "Scissors")
         self.transition_manager = TransitionManager()
         self.game_manager = GameManager(number_of_games)
-        self.points_manager = PointsManager(np.zeros(self.game_manager.num_of_games, dtype=int),
-                                            np.zeros(self.game_manager.num_of_games, dtype=int))
+        self.points_manager = PointsManager()
         self.previous_user_selection = ""
 
+        self._last_round_str = (f"Round: {self.game_manager.num_round + 1}"
+                                f"/{self.game_manager.num_of_games}")
+        self._last_ai_str = f"AI's score: {self.points_manager.ai_score}"
+        self._last_player_str = f"Player's score: {self.points_manager.player_score}"
+
         root = tk.Tk()
         score_frame = tk.Frame(root)
         score_frame.pack()
-        round_label = tk.Label(root,
-                               text=f"Round: {self.game_manager.num_round + 1}"
-                                    f"/{self.game_manager.num_of_games}", font=("Arial", 16))
-        ai_score_label = tk.Label(score_frame,
-                                  text=f"AI's score: "
-                                       f"{np.sum(self.points_manager.all_ai_points)}",
-                                  font=("Arial", 16))
-        player_score_label = tk.Label(score_frame,
-                                      text=f"Player's score:"
-                                           f" {np.sum(self.points_manager.all_player_points)}",
-                                      font=("Arial", 16))
+        round_label = tk.Label(root, text=self._last_round_str, font=_FONT)
+        ai_score_label = tk.Label(score_frame, text=self._last_ai_str, font=_FONT)
+        player_score_label = tk.Label(score_frame, text=self._last_player_str,
+                                      font=_FONT)
         self.top_label_manager = TopLabelManager(root,
                                                  round_label, ai_score_label, player_score_label)
         self.gui_manager = GUIManager(root, self.top_label_manager, self.play_game)
@@ -312,31 +429,28 @@ class RockPaperScissorsGame:
         Args:
             current_player_selection (str): The player's current selection.
         """
-        if self.game_manager.num_round == self.game_manager.num_of_games:
+        game_manager = self.game_manager
+        transition_manager = self.transition_manager
+        ai_selection_label = self.gui_manager.bottom_label_manager.ai_selection_label
+        if game_manager.num_round == game_manager.num_of_games:
             self.reset_game()
-        elif self.game_manager.num_round == 0:
+        elif game_manager.num_round == 0:
             self.previous_user_selection = current_player_selection
-            ai_selection = np.random.choice(self.states,
-                                            p=self.transition_manager.transition_matrix[0])
-            text = f"AI chose: {ai_selection}"
-            self.gui_manager.bottom_label_manager.ai_selection_label.config(text=text,
-                                                                            font=("Arial", 16))
+            ai_selection = self.states[transition_manager.sample(0, _rand())]
+            ai_selection_label.config(text=f"AI chose: {ai_selection}")
             self.handle_results(current_player_selection, ai_selection)
-            self.game_manager.num_round += 1
+            game_manager.num_round += 1
         else:
             previous_user_selection_index = get_index(self.previous_user_selection)
             current_user_selection_index = get_index(current_player_selection)
-            probability = self.transition_manager.transition_matrix[previous_user_selection_index]
-            ai_selection = np.random.choice(self.states,
-                                            p=probability)
-            text = f"AI chose: {ai_selection}"
-            self.gui_manager.bottom_label_manager.ai_selection_label.config(text=text,
-                                                                            font=("Arial", 16))
-            self.transition_manager.learn(previous_user_selection_index,
-                                          current_user_selection_index)
+            ai_selection = self.states[transition_manager.sample(previous_user_selection_index,
+                                                                 _rand())]
+            ai_selection_label.config(text=f"AI chose: {ai_selection}")
+            transition_manager.learn(previous_user_selection_index,
+                                     current_user_selection_index)
             self.handle_results(current_player_selection, ai_selection)
             self.previous_user_selection = current_player_selection
-            self.game_manager.num_round += 1
+            game_manager.num_round += 1
 
     def handle_results(self, current_player_selection: str, ai_selection: str) -> None:
         """
@@ -347,24 +461,30 @@ class RockPaperScissorsGame:
             ai_selection (str): The AI's current selection.
         """
         result = check_result(current_player_selection, ai_selection)
-        round_result = "You won!" if result == 1 else "You lost!" if result == -1 else "It's a tie!"
-        self.gui_manager.bottom_label_manager.round_result_label.config(text=round_result)
-        self.points_manager.all_player_points[self.game_manager.num_round] = result
-        self.points_manager.all_ai_points[self.game_manager.num_round] = -result
+        self.gui_manager.bottom_label_manager.round_result_label.config(
+            text=_RESULTS[result + 1])
+        points_manager = self.points_manager
+        points_manager.player_score += result
+        points_manager.ai_score -= result
+        if result == 1:
+            points_manager.wins += 1
+        elif result == -1:
+            points_manager.losses += 1
 
     def handle_end_game(self) -> None:
         """
         Handle the end of the game.
         """
-        max_score = np.max([np.sum(self.points_manager.all_ai_points),
-                            np.sum(self.points_manager.all_player_points)])
-        num_rounds_won = np.count_nonzero(self.points_manager.all_player_points == 1)
-        num_rounds_lost = np.count_nonzero(self.points_manager.all_player_points == -1)
+        max_score = max(self.points_manager.ai_score, self.points_manager.player_score)
+        if self.game_manager.num_round != self.game_manager.num_of_games and max_score != 10:
+            return
+        num_rounds_won = self.points_manager.wins
+        num_rounds_lost = self.points_manager.losses
         num_rounds_tied = self.game_manager.num_round - num_rounds_lost - num_rounds_won
 
         if self.game_manager.num_round == self.game_manager.num_of_games:
-            all_ai_points_sum = np.sum(self.points_manager.all_ai_points)
-            all_player_points_sum = np.sum(self.points_manager.all_player_points)
+            all_ai_points_sum = self.points_manager.ai_score
+            all_player_points_sum = self.points_manager.player_score
             if all_ai_points_sum == all_player_points_sum:
                 message = f"Tie \n" \
                           f"Player won {num_rounds_won} rounds, AI won {num_rounds_lost} rounds," \
@@ -376,7 +496,7 @@ class RockPaperScissorsGame:
                           f" and {num_rounds_tied} rounds were tied."
             messagebox.askokcancel("Game Over", message)
         elif max_score == 10:
-            winner = "AI" if np.sum(self.points_manager.all_ai_points) == max_score else "Player"
+            winner = "AI" if self.points_manager.ai_score == max_score else "Player"
             messagebox.askokcancel("Game Over", f"{winner} wins with a score of {max_score}\n"
                                                 f"Player won {num_rounds_won} rounds,"
                                                 f" AI won {num_rounds_lost} rounds,"
@@ -392,31 +512,43 @@ class RockPaperScissorsGame:
         """
         Reset the game state.
         """
-        self.game_manager.num_round = 0
-        self.points_manager = PointsManager(np.zeros(self.game_manager.num_of_games, dtype=int),
-                                            np.zeros(self.game_manager.num_of_games, dtype=int))
+        game_manager = self.game_manager
+        points_manager = PointsManager()
+        game_manager.num_round = 0
+        self.points_manager = points_manager
         self.previous_user_selection = ""
-        self.gui_manager.top_label_manager.round_label.config(
-            text=f"Round: {self.game_manager.num_round + 1}/{self.game_manager.num_of_games}")
-        self.gui_manager.top_label_manager.ai_score_label.config(
-            text=f"AI's score: {np.sum(self.points_manager.all_ai_points)}")
-        self.gui_manager.top_label_manager.player_score_label.config(
-            text=f"Player's score: {np.sum(self.points_manager.all_player_points)}")
-        self.gui_manager.bottom_label_manager.ai_selection_label.config(text="")
-        self.gui_manager.bottom_label_manager.round_result_label.config(text="")
+        self._last_round_str = (f"Round: {game_manager.num_round + 1}"
+                                f"/{game_manager.num_of_games}")
+        self._last_ai_str = f"AI's score: {points_manager.ai_score}"
+        self._last_player_str = f"Player's score: {points_manager.player_score}"
+        top_label_manager = self.gui_manager.top_label_manager
+        bottom_label_manager = self.gui_manager.bottom_label_manager
+        top_label_manager.round_label.config(text=self._last_round_str)
+        top_label_manager.ai_score_label.config(text=self._last_ai_str)
+        top_label_manager.player_score_label.config(text=self._last_player_str)
+        bottom_label_manager.ai_selection_label.config(text="")
+        bottom_label_manager.round_result_label.config(text="")
 
     def update_scores(self) -> None:
         """
-        Update the scores displayed in the GUI.
+        Update the scores displayed in the GUI, writing only labels that changed.
         """
-        n_round = self.game_manager.num_round + 1 if self.game_manager.num_round + 1 <= 30 else 30
-        n_games = self.game_manager.num_of_games
-        self.gui_manager.top_label_manager.round_label.config(text=f"Round: {n_round}/"
-                                                                   f"{n_games}")
-        self.gui_manager.top_label_manager.ai_score_label.config(
-            text=f"AI's score: {np.sum(self.points_manager.all_ai_points)}")
-        self.gui_manager.top_label_manager.player_score_label.config(
-            text=f"Player's score: {np.sum(self.points_manager.all_player_points)}")
+        top_label_manager = self.gui_manager.top_label_manager
+        game_manager = self.game_manager
+        points_manager = self.points_manager
+        n_round = game_manager.num_round + 1 if game_manager.num_round + 1 <= 30 else 30
+        round_str = f"Round: {n_round}/{game_manager.num_of_games}"
+        ai_str = f"AI's score: {points_manager.ai_score}"
+        player_str = f"Player's score: {points_manager.player_score}"
+        if round_str != self._last_round_str:
+            self._last_round_str = round_str
+            top_label_manager.round_label.config(text=round_str)
+        if ai_str != self._last_ai_str:
+            self._last_ai_str = ai_str
+            top_label_manager.ai_score_label.config(text=ai_str)
+        if player_str != self._last_player_str:
+            self._last_player_str = player_str
+            top_label_manager.player_score_label.config(text=player_str)
 
     def start_game(self) -> None:
         """